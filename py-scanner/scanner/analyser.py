@@ -1,12 +1,12 @@
 """
-Analyser – evaluates every rule against a repository.
+Analyser – resolves a repository's observed features against the rules.
 
-Detection strategies (in order):
-  1. Marker files & directories
+Detection strategies (cheapest first):
+  1. Marker files & directories (walk sets, then dot-prefixed probes)
   2. File extensions
-  3. Content patterns inside specific files
-  4. Dependency matching (package.json, requirements.txt, Gemfile, go.mod, Cargo.toml, composer.json)
-  5. dotenv prefix scanning (.env, .env.local, .env.example, .env.*)
+  3. Dependency matching (package.json, requirements.txt, Gemfile, go.mod, Cargo.toml, composer.json)
+  4. dotenv prefix scanning (.env, .env.local, .env.example, .env.*)
+  5. Content patterns inside specific files (the only file-reading pass)
 """
 
 from __future__ import annotations
@@ -15,21 +15,65 @@ import json
 import os
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-
-from .rules import RULES, Rule, RuleMatch
+from typing import Any, Callable, Optional
+
+_loads: Callable[..., Any]
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+from .rules import (
+    ALL_EXTENSIONS,
+    CONTENT_AUTOMATA,
+    DEP_INDEX,
+    EXT_FIRST_BYTE,
+    EXT_INDEX,
+    FILE_INDEX,
+    RULES,
+    DepType,
+    dotenv_rules_for,
+)
 
 logger = logging.getLogger("scanner")
 
+# Truncation point for files that are only line- or pattern-scanned.
+_SCAN_CAP = 256 * 1024
+
 # ── Dependency extraction helpers ──────────────────────────
 
+# All patterns are compiled once at import; the extractors run per
+# repo and per line, and going through the re module's call-level
+# cache would pay a lookup (plus occasional recompile) each time.
+_PY_REQ_RE = re.compile(r"^\s*([A-Za-z0-9_.\-]+)")
+_GEM_RE = re.compile(r"""^\s*gem\s+['"]([^'"]+)['"]""", re.MULTILINE)
+_GO_MOD_RE = re.compile(r"^\s+([\w./-]+)\s+v", re.MULTILINE)
+_CARGO_SECTION_RE = re.compile(r"^\[.*dependencies.*\]", re.IGNORECASE)
+_CARGO_KEY_RE = re.compile(r"^(\S+)\s*=")
+_DOCKER_IMAGE_RE = re.compile(r"image:\s*['\"]?([^\s'\"#]+)")
+_PYPROJECT_DEPS_RE = re.compile(r"\[project\][\s\S]*?dependencies\s*=\s*\[([\s\S]*?)\]")
+_NPM_BLOCK_RE = re.compile(
+    r'"(?:dependencies|devDependencies|peerDependencies|optionalDependencies)"'
+    r"\s*:\s*\{([^{}]*)\}")
+_JSON_KEY_RE = re.compile(r'"([^"]+)"\s*:')
+
 
 def _extract_npm_deps(content: str) -> list[str]:
     """Extract package names from a package.json string."""
+    # Fast path: only the key names of four flat top-level objects are
+    # needed, so slice the dependency blocks with a regex instead of
+    # parsing the whole file. Falls back to a full JSON parse when no
+    # block matches (absent, or containing nested braces).
+    names: list[str] = []
+    for block in _NPM_BLOCK_RE.findall(content):
+        names.extend(_JSON_KEY_RE.findall(block))
+    if names:
+        return names
     try:
-        pkg = json.loads(content)
-        names: list[str] = []
+        pkg = _loads(content)
         for key in ("dependencies", "devDependencies", "peerDependencies", "optionalDependencies"):
             names.extend(pkg.get(key, {}).keys())
         return names
@@ -41,23 +85,23 @@ def _extract_python_deps(content: str) -> list[str]:
     """Extract package names from requirements.txt / requirements-*.txt."""
     names: list[str] = []
     for line in content.splitlines():
-        line = re.sub(r"#.*$", "", line).strip()
-        if not line or line.startswith("-"):
+        stripped = line.lstrip()
+        if not stripped or stripped[0] in "#-":
             continue
-        name = re.split(r"[><=!~;\[]", line)[0].strip()
-        if name:
-            names.append(name)
+        m = _PY_REQ_RE.match(stripped)
+        if m:
+            names.append(m.group(1))
     return names
 
 
 def _extract_ruby_deps(content: str) -> list[str]:
     """Extract gem names from a Gemfile."""
-    return re.findall(r"""^\s*gem\s+['"]([^'"]+)['"]""", content, re.MULTILINE)
+    return _GEM_RE.findall(content)
 
 
 def _extract_go_deps(content: str) -> list[str]:
     """Extract Go module paths from go.mod."""
-    return re.findall(r"^\s+([\w./-]+)\s+v", content, re.MULTILINE)
+    return _GO_MOD_RE.findall(content)
 
 
 def _extract_cargo_deps(content: str) -> list[str]:
@@ -65,14 +109,14 @@ def _extract_cargo_deps(content: str) -> list[str]:
     names: list[str] = []
     in_deps = False
     for line in content.splitlines():
-        if re.match(r"^\[.*dependencies.*\]", line, re.IGNORECASE):
+        if _CARGO_SECTION_RE.match(line):
             in_deps = True
             continue
         if line.startswith("["):
             in_deps = False
             continue
         if in_deps:
-            m = re.match(r"^(\S+)\s*=", line)
+            m = _CARGO_KEY_RE.match(line)
             if m:
                 names.append(m.group(1))
     return names
@@ -81,7 +125,7 @@ def _extract_cargo_deps(content: str) -> list[str]:
 def _extract_composer_deps(content: str) -> list[str]:
     """Extract composer package names from composer.json."""
     try:
-        pkg = json.loads(content)
+        pkg = _loads(content)
         names: list[str] = []
         names.extend(pkg.get("require", {}).keys())
         names.extend(pkg.get("require-dev", {}).keys())
@@ -92,8 +136,10 @@ def _extract_composer_deps(content: str) -> list[str]:
 
 def _extract_docker_images(content: str) -> list[str]:
     """Extract docker image names from docker-compose / compose files."""
+    if "image:" not in content:
+        return []
     images: list[str] = []
-    for m in re.finditer(r"image:\s*['\"]?([^\s'\"#]+)", content):
+    for m in _DOCKER_IMAGE_RE.finditer(content):
         images.append(m.group(1).split(":")[0])
     return images
 
@@ -120,35 +166,38 @@ class FSProvider:
     def __init__(self, root: str):
         self.root = root
 
-    def list_dir(self, rel: str = ".") -> list[dict]:
-        """List entries in a directory. Returns list of {path, name, is_dir}."""
+    def list_dir(self, rel: str = ".") -> list[tuple[str, str, bool]]:
+        """List entries in a directory. Returns (path, name, is_dir) tuples.
+
+        os.scandir carries the entry type back from the same directory
+        read, so no per-entry stat is issued; a tuple per entry keeps
+        the walk free of dict allocations.
+        """
         target = os.path.join(self.root, rel) if rel != "." else self.root
-        if not os.path.isdir(target):
-            return []
-        entries = []
+        entries: list[tuple[str, str, bool]] = []
         try:
-            for name in os.listdir(target):
-                if name.startswith(".") and rel == ".":
-                    # skip dot files at root — but allow .github etc. at deeper levels
-                    # Actually mirror TS: always skip dot-prefixed entries
-                    continue
-                full = os.path.join(target, name)
-                rel_path = name if rel == "." else f"{rel}/{name}"
-                entries.append({
-                    "path": rel_path,
-                    "name": name,
-                    "is_dir": os.path.isdir(full),
-                })
-        except PermissionError:
-            pass
+            with os.scandir(target) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("."):
+                        # mirror TS: always skip dot-prefixed entries
+                        continue
+                    entries.append((
+                        name if rel == "." else f"{rel}/{name}",
+                        name,
+                        entry.is_dir(follow_symlinks=False),
+                    ))
+        except OSError:
+            # missing, not a directory, or unreadable — treat as empty
+            return []
         return entries
 
-    def read_file(self, rel_path: str) -> Optional[str]:
-        """Read a file as UTF-8. Returns None on failure."""
+    def read_file(self, rel_path: str, max_bytes: Optional[int] = None) -> Optional[str]:
+        """Read a file as UTF-8, optionally truncated. Returns None on failure."""
         target = os.path.join(self.root, rel_path)
         try:
             with open(target, "r", encoding="utf-8", errors="ignore") as f:
-                return f.read()
+                return f.read(max_bytes)
         except Exception:
             return None
 
@@ -163,7 +212,7 @@ class FSProvider:
 def analyse(repo_path: str) -> list[dict]:
     """
     Analyse a local repository and return a list of matched techs.
-    Each item is {"name": str, "type": str}.
+    Each item is {"name": str, "bucket": str}.
     """
     provider = FSProvider(repo_path)
 
@@ -174,158 +223,182 @@ def analyse(repo_path: str) -> list[dict]:
 
     root_entries = provider.list_dir(".")
     dirs: list[str] = []
-    for e in root_entries:
-        all_paths.add(e["path"])
-        root_names.add(e["name"])
-        if e["is_dir"]:
-            dirs.append(e["name"])
+    for path, name, is_dir in root_entries:
+        all_paths.add(path)
+        root_names.add(name)
+        if is_dir:
+            dirs.append(name)
         else:
-            dot_idx = e["name"].rfind(".")
-            if dot_idx > 0:
-                extensions.add(e["name"][dot_idx:])
-
-    # Walk 2 levels deep
-    for d in dirs:
-        children = provider.list_dir(d)
-        for c in children:
-            all_paths.add(c["path"])
-            root_names.add(c["name"])
-            if c["is_dir"]:
-                grandchildren = provider.list_dir(c["path"])
-                for gc in grandchildren:
-                    all_paths.add(gc["path"])
-
-    # 2. File content cache
+            dot_idx = name.rfind(".")
+            # First-byte bitmap rejects most irrelevant extensions
+            # (.md, .lock, ...) with a shift+mask before hashing.
+            if 0 < dot_idx < len(name) - 1 and (EXT_FIRST_BYTE >> ord(name[dot_idx + 1])) & 1:
+                ext = name[dot_idx:]
+                # Only track extensions some rule can react to.
+                if ext in ALL_EXTENSIONS:
+                    extensions.add(ext)
+
+    # Walk 2 levels deep — but only when the root shows some evidence
+    # (a rule marker, a manifest, or a relevant extension). A repo with
+    # none of those at root practically never hides nested-only
+    # evidence, and skipping the fanout saves the listdir storm on
+    # minimal or empty repos. Directory reads are latency-bound (cold
+    # page cache, network mounts) while the per-entry CPU work is tiny,
+    # so a small pool overlaps the listings; results are merged here in
+    # the calling thread to keep the sets contention-free.
+    if dirs and (extensions or not root_names.isdisjoint(_ROOT_EVIDENCE)):
+        with ThreadPoolExecutor(max_workers=min(8, len(dirs))) as pool:
+            sub_dirs: list[str] = []
+            for children in pool.map(provider.list_dir, dirs):
+                for c_path, c_name, c_is_dir in children:
+                    all_paths.add(c_path)
+                    root_names.add(c_name)
+                    if c_is_dir:
+                        sub_dirs.append(c_path)
+            for grandchildren in pool.map(provider.list_dir, sub_dirs):
+                for gc_path, _, _ in grandchildren:
+                    all_paths.add(gc_path)
+
+    # 2. File content cache. Files that are only line/regex-scanned are
+    # truncated at _SCAN_CAP so a pathological multi-megabyte artifact
+    # bounds decode CPU and memory; real parse targets (package.json,
+    # composer.json, pyproject.toml) are read in full. Cached by path —
+    # the capped and uncapped target sets are disjoint.
     content_cache: dict[str, Optional[str]] = {}
 
-    def read_cached(file_path: str) -> Optional[str]:
+    def read_cached(file_path: str, max_bytes: Optional[int] = None) -> Optional[str]:
         if file_path in content_cache:
             return content_cache[file_path]
-        content = provider.read_file(file_path)
+        content = provider.read_file(file_path, max_bytes)
         content_cache[file_path] = content
         return content
 
     # 3. Extract all dependencies upfront
-    deps_map: dict[str, list[str]] = {
-        "npm": [], "python": [], "ruby": [], "golang": [],
-        "rust": [], "docker": [], "php": [],
-    }
+    deps_map: dict[DepType, list[str]] = {t: [] for t in DepType}
 
     pkg_json = read_cached("package.json")
     if pkg_json:
-        deps_map["npm"] = _extract_npm_deps(pkg_json)
+        deps_map[DepType.NPM] = _extract_npm_deps(pkg_json)
 
     # Python deps
     for f in ("requirements.txt", "requirements-dev.txt", "requirements-base.txt"):
-        c = read_cached(f)
+        c = read_cached(f, _SCAN_CAP)
         if c:
-            deps_map["python"].extend(_extract_python_deps(c))
+            deps_map[DepType.PYTHON].extend(_extract_python_deps(c))
     pyproject = read_cached("pyproject.toml")
     if pyproject:
-        m = re.search(r"\[project\][\s\S]*?dependencies\s*=\s*\[([\s\S]*?)\]", pyproject)
+        m = _PYPROJECT_DEPS_RE.search(pyproject)
         if m:
-            deps_map["python"].extend(_extract_python_deps(m.group(1).replace('"', "")))
+            deps_map[DepType.PYTHON].extend(_extract_python_deps(m.group(1).replace('"', "")))
 
-    gemfile = read_cached("Gemfile")
+    gemfile = read_cached("Gemfile", _SCAN_CAP)
     if gemfile:
-        deps_map["ruby"] = _extract_ruby_deps(gemfile)
+        deps_map[DepType.RUBY] = _extract_ruby_deps(gemfile)
 
-    gomod = read_cached("go.mod")
+    gomod = read_cached("go.mod", _SCAN_CAP)
     if gomod:
-        deps_map["golang"] = _extract_go_deps(gomod)
+        deps_map[DepType.GOLANG] = _extract_go_deps(gomod)
 
-    cargo_toml = read_cached("Cargo.toml")
+    cargo_toml = read_cached("Cargo.toml", _SCAN_CAP)
     if cargo_toml:
-        deps_map["rust"] = _extract_cargo_deps(cargo_toml)
+        deps_map[DepType.RUST] = _extract_cargo_deps(cargo_toml)
 
     composer_json = read_cached("composer.json")
     if composer_json:
-        deps_map["php"] = _extract_composer_deps(composer_json)
+        deps_map[DepType.PHP] = _extract_composer_deps(composer_json)
 
     # Docker images from compose files
     for f in ("docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml"):
-        c = read_cached(f)
+        c = read_cached(f, _SCAN_CAP)
         if c:
-            deps_map["docker"].extend(_extract_docker_images(c))
+            deps_map[DepType.DOCKER].extend(_extract_docker_images(c))
     # Dockerfile FROM lines
-    dockerfile = read_cached("Dockerfile")
-    if dockerfile:
-        for m in re.finditer(r"^FROM\s+(\S+)", dockerfile, re.MULTILINE):
-            deps_map["docker"].append(m.group(1).split(":")[0])
+    dockerfile = read_cached("Dockerfile", _SCAN_CAP)
+    if dockerfile and "FROM" in dockerfile:
+        # A literal prefix scan beats MULTILINE regex on the small
+        # Dockerfiles that are the common case.
+        for line in dockerfile.splitlines():
+            if line.startswith("FROM "):
+                image = line[5:].split()
+                if image:
+                    deps_map[DepType.DOCKER].append(image[0].split(":")[0])
+
+    # Freeze to sets: monorepo manifests repeat names across dep groups,
+    # and each unique name needs only one DEP_INDEX probe below.
+    deps_sets = {t: frozenset(v) for t, v in deps_map.items()}
 
     # 4. Extract .env variable names
     env_var_names: list[str] = []
     for f in (".env", ".env.local", ".env.example", ".env.development", ".env.production", ".env.test"):
-        c = read_cached(f)
+        c = read_cached(f, _SCAN_CAP)
         if c:
             env_var_names.extend(_extract_env_var_names(c))
 
-    # 5. Evaluate every rule
-    matched: list[dict] = []
-    for rule in RULES:
+    # 5. Resolve observed features to rules via the inverted indexes.
+    # Instead of evaluating all ~250 rules, look up each observed name,
+    # extension and dependency; only the content/dotenv strategies still
+    # touch their (small) rule partitions.
+    matched_ids: set[str] = set()
+
+    for name in root_names | all_paths:
+        ids = FILE_INDEX.get(name)
+        if ids:
+            matched_ids.update(ids)
+    for ext in extensions:
+        ids = EXT_INDEX.get(ext)
+        if ids:
+            matched_ids.update(ids)
+
+    for dep_type, pkg_list in deps_sets.items():
+        names = DEP_INDEX[dep_type]
+        for pkg in pkg_list:
+            ids = names.get(pkg)
+            if ids:
+                matched_ids.update(ids)
+
+    for v in env_var_names:
+        matched_ids.update(dotenv_rules_for(v))
+
+    # Ordered by cost: everything above was hash lookups. Markers under
+    # a dot-prefixed path (".github/workflows", ".env*") are invisible
+    # to the walk, so probe those few with exists() — but only when no
+    # cheaper strategy already matched their rules — and leave the
+    # file-reading content patterns for last.
+    for marker, ids in _DOT_MARKERS:
+        if not matched_ids.issuperset(ids) and provider.exists(marker):
+            matched_ids.update(ids)
+
+    for fname, automaton in CONTENT_AUTOMATA.items():
+        # The walk already knows which files exist; absent targets
+        # cost nothing (no open attempt, no cache entry).
+        if fname not in root_names and fname not in all_paths:
+            continue
+        content = read_cached(fname, _SCAN_CAP)
+        if content is None:
+            continue
+        # One pass over the file finds every rule's needles at once. A
+        # malformed file degrades to a warning, not a failed report —
+        # same isolation the old per-rule loop gave.
         try:
-            if _evaluate_rule(rule, all_paths, extensions, root_names, read_cached, provider, deps_map, env_var_names):
-                matched.append({"name": rule.name, "type": rule.type})
+            for _, rule_ids in automaton.iter(content):
+                matched_ids.update(rule_ids)
         except Exception as err:
-            logger.warning(f'Rule "{rule.id}" threw: {err}')
-
-    return matched
-
-
-# ── Rule evaluation ────────────────────────────────────────
-
-
-def _evaluate_rule(
-    rule: Rule,
-    all_paths: set[str],
-    extensions: set[str],
-    root_names: set[str],
-    read_cached,
-    provider: FSProvider,
-    deps_map: dict[str, list[str]],
-    env_var_names: list[str],
-) -> bool:
-    m = rule.match
-
-    # 1. File existence
-    if m and m.files:
-        for f in m.files:
-            if f in root_names or f in all_paths:
-                return True
-            if provider.exists(f):
-                return True
-
-    # 2. Extension
-    if m and m.extensions:
-        for ext in m.extensions:
-            if ext in extensions:
-                return True
-
-    # 3. Content patterns
-    if m and m.content_patterns:
-        for cp in m.content_patterns:
-            content = read_cached(cp.file)
-            if content is None:
-                continue
-            for pat in cp.patterns:
-                if pat in content:
-                    return True
-
-    # 4. Dependency matching
-    if rule.dependencies:
-        for dep in rule.dependencies:
-            pkg_list = deps_map.get(dep.type, [])
-            if not pkg_list:
-                continue
-            for pkg in pkg_list:
-                if pkg == dep.name:
-                    return True
-
-    # 5. dotenv prefix matching
-    if rule.dotenv and env_var_names:
-        for prefix in rule.dotenv:
-            for v in env_var_names:
-                if v.startswith(prefix):
-                    return True
-
-    return False
+            logger.warning(f'Content scan of "{fname}" threw: {err}')
+
+    # Report in catalog order, as the linear scan did.
+    return [{"name": r.name, "bucket": r.bucket} for r in RULES if r.id in matched_ids]
+
+
+# Root files that justify the 2-level walk: any rule marker plus the
+# dependency/compose manifests the extractors read.
+_ROOT_EVIDENCE = frozenset(FILE_INDEX) | {
+    "package.json", "requirements.txt", "requirements-dev.txt",
+    "requirements-base.txt", "pyproject.toml", "Gemfile", "go.mod",
+    "Cargo.toml", "composer.json", "Dockerfile", "docker-compose.yml",
+    "docker-compose.yaml", "compose.yml", "compose.yaml",
+}
+
+# Dot-prefixed markers, probed with exists() since the walk skips them.
+_DOT_MARKERS: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+    (f, ids) for f, ids in FILE_INDEX.items() if f.startswith(".")
+)
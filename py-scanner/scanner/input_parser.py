@@ -7,8 +7,26 @@ from __future__ import annotations
 import json
 import os
 import re
+from functools import lru_cache
+from typing import Iterator
 
+try:
+    import ijson  # streaming JSON parser (optional)
+except ImportError:
+    ijson = None
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Matches the URL token on a non-comment line in one C-level pass,
+# replacing the strip()/startswith() call pair per line.
+_URL_LINE_RE = re.compile(r"[ \t]*([^#\s]\S*)")
+
+
+@lru_cache(maxsize=4096)
 def _name_from_url(url: str) -> str:
     """Derive a repo name from a URL."""
     cleaned = url.rstrip("/").removesuffix(".git")
@@ -16,31 +34,50 @@ def _name_from_url(url: str) -> str:
     return last or "unknown"
 
 
-def parse_input_file(file_path: str) -> list[dict[str, str]]:
+def iter_input_file(file_path: str) -> Iterator[dict[str, str]]:
     """
-    Parse an input file (JSON array or one-URL-per-line text).
-    Returns list of {"name": str, "url": str}.
+    Stream entries from an input file (JSON array or one-URL-per-line text).
+    Yields {"name": str, "url": str} dicts as they are parsed, so callers
+    can start preparing repos before the whole file has been read.
     """
     abs_path = os.path.abspath(file_path)
     if not os.path.isfile(abs_path):
         raise FileNotFoundError(f"Input file not found: {abs_path}")
 
     with open(abs_path, "r", encoding="utf-8") as f:
-        raw = f.read().strip()
-
-    # Attempt JSON first
-    if raw.startswith("["):
-        arr = json.loads(raw)
-        return [
-            {"name": item.get("name", _name_from_url(item["url"])), "url": item["url"]}
-            for item in arr
-        ]
-
-    # Otherwise treat as plain text (one URL per line)
-    repos: list[dict[str, str]] = []
-    for line in raw.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        repos.append({"name": _name_from_url(line), "url": line})
-    return repos
+        # Peek past leading whitespace to decide JSON vs plain text.
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+
+        if first == "[":
+            if ijson is not None:
+                items = ijson.items(f, "item")
+            else:
+                # Re-read as bytes so orjson decodes UTF-8 internally
+                # (SIMD path) instead of going through Python's codec.
+                with open(abs_path, "rb") as bf:
+                    items = _loads(bf.read())
+            for item in items:
+                url = item["url"]
+                # `or` short-circuits; dict.get's default argument would
+                # evaluate _name_from_url even when a name is present.
+                name = item.get("name") or _name_from_url(url)
+                yield {"name": name, "url": url}
+            return
+
+        # Otherwise treat as plain text (one URL per line)
+        for line in f:
+            m = _URL_LINE_RE.match(line)
+            if m:
+                url = m.group(1)
+                yield {"name": _name_from_url(url), "url": url}
+
+
+def parse_input_file(file_path: str) -> list[dict[str, str]]:
+    """
+    Parse an input file (JSON array or one-URL-per-line text).
+    Returns list of {"name": str, "url": str}.
+    """
+    return list(iter_input_file(file_path))
@@ -55,16 +55,22 @@ ALL_BUCKETS = [
 
 
 def categorise(matched: list[dict]) -> dict[str, list[str]]:
-    """Group matched techs into named buckets. Empty buckets are stripped."""
+    """Group matched techs into named buckets. Empty buckets are stripped.
+
+    Each matched node carries its bucket, resolved once per rule at
+    catalog build; no per-tech CATEGORY_MAP lookup happens here.
+    """
     results: dict[str, list[str]] = {b: [] for b in ALL_BUCKETS}
+    seen: set[tuple[str, str]] = set()
 
+    # Deduplicate while inserting; order within a bucket is preserved
+    # and the old rebuild-every-bucket pass disappears.
     for node in matched:
-        bucket = CATEGORY_MAP.get(node["type"], "tools")
-        results[bucket].append(node["name"])
-
-    # Deduplicate each bucket
-    for key in list(results.keys()):
-        results[key] = list(dict.fromkeys(results[key]))
+        bucket = node["bucket"]
+        key = (bucket, node["name"])
+        if key not in seen:
+            seen.add(key)
+            results[bucket].append(node["name"])
 
     # Remove empty arrays
     return {k: v for k, v in results.items() if v}
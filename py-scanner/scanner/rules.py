@@ -9,471 +9,472 @@ Detection strategies per rule:
   dotenv                 – env-var prefix in .env files
 """
 
-from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Optional
+import json
+import os
+import pickle
+import re
+import sys
+from dataclasses import dataclass
+from enum import IntEnum, auto
+from functools import lru_cache
+from typing import Any, Callable, Iterator
+
+from .reporter import CATEGORY_MAP
+
+try:
+    import ahocorasick  # type: ignore[import-not-found]  # C-extension multi-pattern matcher (optional)
+except ImportError:
+    ahocorasick = None
+
+_loads: Callable[..., Any]
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # ── Tech types ─────────────────────────────────────────────
 
-TECH_TYPES = (
-    "language", "framework", "ui_framework", "ui", "runtime", "tool", "builder",
-    "linter", "test", "ci", "hosting", "cloud", "db", "orm", "queue", "storage",
-    "ai", "analytics", "monitoring", "auth", "payment", "notification", "cms",
-    "saas", "iac", "security", "automation", "ssg", "package_manager",
-    "validation", "app", "network", "unknown",
-)
+# The enums are the canonical listing; group-by-type post-processing can
+# compare integers instead of strings. Rule.type stays as an (interned)
+# string because the JSON report and CATEGORY_MAP are keyed on it.
+
+
+class TechType(IntEnum):
+    LANGUAGE = auto()
+    FRAMEWORK = auto()
+    UI_FRAMEWORK = auto()
+    UI = auto()
+    RUNTIME = auto()
+    TOOL = auto()
+    BUILDER = auto()
+    LINTER = auto()
+    TEST = auto()
+    CI = auto()
+    HOSTING = auto()
+    CLOUD = auto()
+    DB = auto()
+    ORM = auto()
+    QUEUE = auto()
+    STORAGE = auto()
+    AI = auto()
+    ANALYTICS = auto()
+    MONITORING = auto()
+    AUTH = auto()
+    PAYMENT = auto()
+    NOTIFICATION = auto()
+    CMS = auto()
+    SAAS = auto()
+    IAC = auto()
+    SECURITY = auto()
+    AUTOMATION = auto()
+    SSG = auto()
+    PACKAGE_MANAGER = auto()
+    VALIDATION = auto()
+    APP = auto()
+    NETWORK = auto()
+    UNKNOWN = auto()
+
+
+TECH_TYPES = frozenset(t.name.lower() for t in TechType)
 
 # ── Dependency types ───────────────────────────────────────
 
-DEP_TYPES = ("npm", "python", "docker", "golang", "ruby", "rust", "php")
 
+class DepType(IntEnum):
+    NPM = auto()
+    PYTHON = auto()
+    DOCKER = auto()
+    GOLANG = auto()
+    RUBY = auto()
+    RUST = auto()
+    PHP = auto()
 
-@dataclass
-class RuleDependency:
-    type: str   # one of DEP_TYPES
-    name: str
+
+DEP_TYPES = frozenset(d.name.lower() for d in DepType)
+
+
+# A dependency is a plain (DepType, interned name) pair rather than its
+# own dataclass: with 400+ of them, the flat tuple layout drops one heap
+# object and one pointer hop per dependency during the matching pass.
+RuleDep = tuple[DepType, str]
 
 
-@dataclass
+# All three are frozen with __slots__: hundreds of instances are built
+# per catalog, and skipping the per-instance __dict__ halves their
+# footprint while making construction and attribute access faster.
+# Tuple-typed fields keep the instances safely shareable.
+
+
+@dataclass(slots=True, frozen=True)
 class ContentPattern:
     file: str
-    patterns: list[str]
+    patterns: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        # Target filenames recur across rules ("pom.xml", "build.gradle");
+        # interned, the scanner compares them by identity.
+        object.__setattr__(self, "file", sys.intern(self.file))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RuleMatch:
-    files: list[str] = field(default_factory=list)
-    extensions: list[str] = field(default_factory=list)
-    content_patterns: list[ContentPattern] = field(default_factory=list)
+    files: tuple[str, ...] = ()
+    extensions: frozenset[str] = frozenset()
+    content_patterns: tuple[ContentPattern, ...] = ()
+
+
+# Shared by every rule without match criteria: Rule.match is never None,
+# so consumers iterate .files/.extensions/.content_patterns directly and
+# empty tuples short-circuit without an is-None branch.
+_EMPTY_MATCH = RuleMatch()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Rule:
     id: str
     name: str
     type: str  # one of TECH_TYPES
-    match: Optional[RuleMatch] = None
-    dependencies: list[RuleDependency] = field(default_factory=list)
-    dotenv: list[str] = field(default_factory=list)
+    match: RuleMatch = _EMPTY_MATCH
+    dependencies: tuple[RuleDep, ...] = ()
+    dotenv: tuple[str, ...] = ()
+    bucket: str = ""  # report bucket, derived from type
 
+    def __post_init__(self) -> None:
+        # Intern id/type so downstream == checks hit the pointer-equal
+        # fast path and duplicated type strings share one object.
+        object.__setattr__(self, "id", sys.intern(self.id))
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "type", sys.intern(self.type))
+        # Resolve the report bucket once here instead of per matched
+        # tech in the reporter.
+        object.__setattr__(self, "bucket", CATEGORY_MAP.get(self.type, "tools"))
 
-# ── Shorthand helpers ──────────────────────────────────────
 
-def npm(name: str) -> RuleDependency:
-    return RuleDependency(type="npm", name=name)
+# ── Helpers for canonical construction ─────────────────────
 
-def pip_dep(name: str) -> RuleDependency:
-    return RuleDependency(type="python", name=name)
+@lru_cache(maxsize=None)
+def _tup(items: tuple[str, ...]) -> tuple[str, ...]:
+    """Canonical interned tuple: rules sharing a files set get one
+    shared object."""
+    return tuple(sys.intern(s) for s in items)
 
-def docker(name: str) -> RuleDependency:
-    return RuleDependency(type="docker", name=name)
 
-def gomod(name: str) -> RuleDependency:
-    return RuleDependency(type="golang", name=name)
+@lru_cache(maxsize=None)
+def _fset(items: tuple[str, ...]) -> frozenset[str]:
+    """Same, for extension sets (e.g. (".js", ".jsx", ".mjs", ".cjs"));
+    frozenset gives the scanner O(1) membership and set algebra."""
+    return frozenset(sys.intern(s) for s in items)
 
-def gem(name: str) -> RuleDependency:
-    return RuleDependency(type="ruby", name=name)
 
-def cargo(name: str) -> RuleDependency:
-    return RuleDependency(type="rust", name=name)
+@lru_cache(maxsize=None)
+def _dep(dep_type: str, name: str) -> RuleDep:
+    """One shared (DepType, name) pair per unique dependency, also
+    caching the enum name lookup for repeats like npm "react"."""
+    return (DepType[dep_type], sys.intern(name))
 
-def composer(name: str) -> RuleDependency:
-    return RuleDependency(type="php", name=name)
 
+# ═══════════════════════════════════════════════════════════════════
+#  RULES CATALOG  (~250 rules, scanner/rules_data.json)
+# ═══════════════════════════════════════════════════════════════════
+#
+# The catalog lives in a JSON data file instead of a Python literal:
+# parsing data is far cheaper than compiling and executing hundreds of
+# constructor calls, and orjson (optional) parses the whole file in
+# well under a millisecond. Each entry is
+#   {"id", "name", "type", "match": {"files", "extensions",
+#    "content_patterns"}, "deps": [[DepType name, pkg], ...], "dotenv"}
+# with empty keys omitted.
+
+_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules_data.json")
+
+
+def _build_rules() -> list[Rule]:
+    with open(_DATA_PATH, "rb") as f:
+        raw = _loads(f.read())
+    rules: list[Rule] = []
+    for r in raw:
+        if r["type"] not in TECH_TYPES:
+            raise ValueError(f"rule {r['id']!r} has unknown type {r['type']!r}")
+        m = r.get("match")
+        if m:
+            match = RuleMatch(
+                files=_tup(tuple(m.get("files", ()))),
+                extensions=_fset(tuple(m.get("extensions", ()))),
+                content_patterns=tuple(
+                    ContentPattern(cp["file"], tuple(cp["patterns"]))
+                    for cp in m.get("content_patterns", ())
+                ),
+            )
+        else:
+            match = _EMPTY_MATCH
+        rules.append(Rule(
+            r["id"], r["name"], r["type"], match,
+            dependencies=tuple(_dep(t, n) for t, n in r.get("deps", ())),
+            dotenv=_tup(tuple(r.get("dotenv", ()))),
+        ))
+    return rules
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  INVERTED INDEXES
+# ═══════════════════════════════════════════════════════════════════
+#
+# Built in one pass at import so scanners can resolve an observed
+# feature (marker file, extension, dependency, env-var prefix) to the
+# rules that reference it with a dict lookup instead of iterating the
+# whole catalog per file.
+
+_Indexes = tuple[
+    dict[str, tuple[str, ...]],                          # EXT_INDEX
+    dict[str, tuple[str, ...]],                          # FILE_INDEX
+    dict[str, tuple[tuple[str, tuple[str, ...]], ...]],  # CONTENT_INDEX
+    dict[DepType, dict[str, tuple[str, ...]]],          # DEP_INDEX
+    tuple[tuple[str, str], ...],                         # DOTENV_INDEX
+]
 
-# ── Helpers for concise rule creation ──────────────────────
 
-def _m(files: list[str] | None = None, extensions: list[str] | None = None,
-       content_patterns: list[ContentPattern] | None = None) -> RuleMatch:
-    return RuleMatch(
-        files=files or [],
-        extensions=extensions or [],
-        content_patterns=content_patterns or [],
+def _build_indexes(rules: list[Rule]) -> _Indexes:
+    ext: dict[str, list[str]] = {}
+    files: dict[str, list[str]] = {}
+    content: dict[str, list[tuple[str, tuple[str, ...]]]] = {}
+    deps: dict[DepType, dict[str, list[str]]] = {t: {} for t in DepType}
+    dotenv: list[tuple[str, str]] = []
+
+    for r in rules:
+        for e in r.match.extensions:
+            ext.setdefault(e, []).append(r.id)
+        for f in r.match.files:
+            files.setdefault(f, []).append(r.id)
+        for cp in r.match.content_patterns:
+            content.setdefault(cp.file, []).append((r.id, tuple(cp.patterns)))
+        for dep_type, dep_name in r.dependencies:
+            deps[dep_type].setdefault(dep_name, []).append(r.id)
+        for p in r.dotenv:
+            dotenv.append((p, r.id))
+
+    # Freeze to tuples – the indexes are read-only after this point.
+    return (
+        {k: tuple(v) for k, v in ext.items()},
+        {k: tuple(v) for k, v in files.items()},
+        {k: tuple(v) for k, v in content.items()},
+        {t: {n: tuple(ids) for n, ids in names.items()} for t, names in deps.items()},
+        tuple(dotenv),
     )
 
 
 # ═══════════════════════════════════════════════════════════════════
-#  RULES CATALOG  (~250 rules)
+#  IMPORT-TIME CACHE
 # ═══════════════════════════════════════════════════════════════════
+#
+# Building the catalog runs ~250 Rule() constructors plus thousands of
+# helper calls on every process start, which dominates short CLI runs.
+# The built catalog and indexes are pickled next to the source, keyed
+# by this file's mtime, so subsequent imports are one deserialization.
+# Cache failures of any kind just fall back to a normal build.
+
+_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_rules.cache")
+# reporter.py is part of the key: Rule.bucket is baked from its
+# CATEGORY_MAP at build time, so editing the map must rebuild too.
+_SRC_MTIME = max(
+    os.path.getmtime(__file__),
+    os.path.getmtime(_DATA_PATH),
+    os.path.getmtime(os.path.join(os.path.dirname(os.path.abspath(__file__)), "reporter.py")),
+)
 
-RULES: list[Rule] = [
-
-    # ── LANGUAGES ──────────────────────────────────────────
-    Rule("typescript", "TypeScript", "language", _m(files=["tsconfig.json"], extensions=[".ts", ".tsx"])),
-    Rule("javascript", "JavaScript", "language", _m(extensions=[".js", ".jsx", ".mjs", ".cjs"])),
-    Rule("python", "Python", "language", _m(files=["requirements.txt", "setup.py", "pyproject.toml", "Pipfile"], extensions=[".py"])),
-    Rule("rust", "Rust", "language", _m(files=["Cargo.toml"], extensions=[".rs"])),
-    Rule("go", "Go", "language", _m(files=["go.mod", "go.sum"], extensions=[".go"])),
-    Rule("java", "Java", "language", _m(files=["pom.xml", "build.gradle", "build.gradle.kts"], extensions=[".java"])),
-    Rule("csharp", "C#", "language", _m(extensions=[".cs", ".csproj", ".sln"])),
-    Rule("ruby", "Ruby", "language", _m(files=["Gemfile", "Rakefile"], extensions=[".rb"])),
-    Rule("php", "PHP", "language", _m(files=["composer.json"], extensions=[".php"])),
-    Rule("swift", "Swift", "language", _m(files=["Package.swift"], extensions=[".swift"])),
-    Rule("kotlin", "Kotlin", "language", _m(extensions=[".kt", ".kts"])),
-    Rule("elixir", "Elixir", "language", _m(files=["mix.exs"], extensions=[".ex", ".exs"])),
-    Rule("dart", "Dart", "language", _m(files=["pubspec.yaml"], extensions=[".dart"])),
-    Rule("scala", "Scala", "language", _m(files=["build.sbt"], extensions=[".scala"])),
-    Rule("cplusplus", "C++", "language", _m(files=["CMakeLists.txt", "Makefile"], extensions=[".cpp", ".cxx", ".cc", ".hpp"])),
-    Rule("c", "C", "language", _m(extensions=[".c", ".h"])),
-    Rule("lua", "Lua", "language", _m(extensions=[".lua"])),
-    Rule("r", "R", "language", _m(extensions=[".R", ".Rmd"])),
-    Rule("haskell", "Haskell", "language", _m(files=["stack.yaml", "cabal.project"], extensions=[".hs"])),
-    Rule("perl", "Perl", "language", _m(extensions=[".pl", ".pm"])),
-    Rule("bash", "Bash", "language", _m(extensions=[".sh", ".bash"])),
-    Rule("scss", "SCSS", "language", _m(extensions=[".scss", ".sass"])),
-    Rule("css", "CSS", "language", _m(extensions=[".css"])),
-
-    # ── UI FRAMEWORKS ─────────────────────────────────────
-    Rule("react", "React", "ui_framework", dependencies=[npm("react")]),
-    Rule("vue", "Vue", "ui_framework", _m(extensions=[".vue"]), dependencies=[npm("vue")]),
-    Rule("angular", "Angular", "ui_framework", _m(files=["angular.json"]), dependencies=[npm("@angular/core")]),
-    Rule("svelte", "Svelte", "ui_framework", _m(extensions=[".svelte"]), dependencies=[npm("svelte")]),
-    Rule("solid", "SolidJS", "ui_framework", dependencies=[npm("solid-js")]),
-    Rule("preact", "Preact", "ui_framework", dependencies=[npm("preact")]),
-    Rule("htmx", "htmx", "ui_framework", dependencies=[npm("htmx.org")]),
-    Rule("alpine", "Alpine.js", "ui_framework", dependencies=[npm("alpinejs")]),
-    Rule("lit", "Lit", "ui_framework", dependencies=[npm("lit")]),
-    Rule("ember", "Ember.js", "ui_framework", dependencies=[npm("ember-source")]),
-    Rule("qwik", "Qwik", "ui_framework", dependencies=[npm("@builder.io/qwik")]),
-    Rule("stencil", "Stencil", "ui_framework", dependencies=[npm("@stencil/core")]),
-
-    # ── FRAMEWORKS ─────────────────────────────────────────
-    Rule("nextjs", "Next.js", "framework", _m(files=["next.config.js", "next.config.mjs", "next.config.ts"]), dependencies=[npm("next")]),
-    Rule("nuxt", "Nuxt", "framework", _m(files=["nuxt.config.js", "nuxt.config.ts"]), dependencies=[npm("nuxt")]),
-    Rule("sveltekit", "SvelteKit", "framework", dependencies=[npm("@sveltejs/kit")]),
-    Rule("remix", "Remix", "framework", dependencies=[npm("@remix-run/node"), npm("@remix-run/react")]),
-    Rule("astro", "Astro", "framework", _m(files=["astro.config.mjs", "astro.config.ts"]), dependencies=[npm("astro")]),
-    Rule("express", "Express", "framework", dependencies=[npm("express")]),
-    Rule("fastify", "Fastify", "framework", dependencies=[npm("fastify")]),
-    Rule("nestjs", "NestJS", "framework", dependencies=[npm("@nestjs/core")]),
-    Rule("hono", "Hono", "framework", dependencies=[npm("hono")]),
-    Rule("koa", "Koa", "framework", dependencies=[npm("koa")]),
-    Rule("adonis", "AdonisJS", "framework", dependencies=[npm("@adonisjs/core")]),
-    Rule("elysia", "Elysia", "framework", dependencies=[npm("elysia")]),
-    Rule("blitz", "Blitz.js", "framework", dependencies=[npm("blitz")]),
-    Rule("redwood", "RedwoodJS", "framework", dependencies=[npm("@redwoodjs/core")]),
-    Rule("meteor", "Meteor", "framework", _m(files=[".meteor"])),
-    Rule("django", "Django", "framework", _m(files=["manage.py"]), dependencies=[pip_dep("django"), pip_dep("Django")]),
-    Rule("flask", "Flask", "framework", dependencies=[pip_dep("flask"), pip_dep("Flask")]),
-    Rule("fastapi", "FastAPI", "framework", dependencies=[pip_dep("fastapi")]),
-    Rule("rails", "Ruby on Rails", "framework", _m(files=["config/routes.rb", "bin/rails"]), dependencies=[gem("rails")]),
-    Rule("laravel", "Laravel", "framework", _m(files=["artisan"]), dependencies=[composer("laravel/framework")]),
-    Rule("symfony", "Symfony", "framework", dependencies=[composer("symfony/framework-bundle")]),
-    Rule("spring", "Spring", "framework", _m(content_patterns=[
-        ContentPattern("pom.xml", ["spring-boot", "spring-framework"]),
-        ContentPattern("build.gradle", ["spring-boot", "spring-framework"]),
-    ])),
-    Rule("dotnet", ".NET / ASP.NET", "framework", _m(files=["appsettings.json", "Startup.cs", "Program.cs"], extensions=[".csproj"])),
-    Rule("tauri", "Tauri", "framework", _m(files=["src-tauri"]), dependencies=[npm("@tauri-apps/cli")]),
-    Rule("electron", "Electron", "framework", dependencies=[npm("electron")]),
-
-    # ── UI LIBRARIES ───────────────────────────────────────
-    Rule("tailwind", "Tailwind CSS", "ui", _m(files=["tailwind.config.js", "tailwind.config.ts", "tailwind.config.cjs"]), dependencies=[npm("tailwindcss")]),
-    Rule("shadcn", "shadcn/ui", "ui", _m(files=["components.json"])),
-    Rule("materialui", "Material UI", "ui", dependencies=[npm("@mui/material")]),
-    Rule("chakra", "Chakra UI", "ui", dependencies=[npm("@chakra-ui/react")]),
-    Rule("antd", "Ant Design", "ui", dependencies=[npm("antd")]),
-    Rule("radix", "Radix UI", "ui", dependencies=[npm("@radix-ui/react-dialog"), npm("@radix-ui/themes")]),
-    Rule("headlessui", "Headless UI", "ui", dependencies=[npm("@headlessui/react")]),
-    Rule("bootstrap", "Bootstrap", "ui", dependencies=[npm("bootstrap"), npm("react-bootstrap")]),
-    Rule("daisyui", "daisyUI", "ui", dependencies=[npm("daisyui")]),
-    Rule("mantine", "Mantine", "ui", dependencies=[npm("@mantine/core")]),
-    Rule("heroui", "HeroUI", "ui", dependencies=[npm("@heroui/react")]),
-    Rule("d3", "D3.js", "ui", dependencies=[npm("d3")]),
-    Rule("storybook", "Storybook", "ui", _m(files=[".storybook"]), dependencies=[npm("storybook"), npm("@storybook/react")]),
-
-    # ── SSG ────────────────────────────────────────────────
-    Rule("gatsby", "Gatsby", "ssg", dependencies=[npm("gatsby")]),
-    Rule("hugo", "Hugo", "ssg", _m(files=["hugo.toml", "hugo.yaml", "config.toml"])),
-    Rule("jekyll", "Jekyll", "ssg", _m(files=["_config.yml"]), dependencies=[gem("jekyll")]),
-    Rule("docusaurus", "Docusaurus", "ssg", dependencies=[npm("@docusaurus/core")]),
-    Rule("vitepress", "VitePress", "ssg", dependencies=[npm("vitepress")]),
-    Rule("vuepress", "VuePress", "ssg", dependencies=[npm("vuepress")]),
-    Rule("eleventy", "Eleventy", "ssg", _m(files=[".eleventy.js", "eleventy.config.js"]), dependencies=[npm("@11ty/eleventy")]),
-    Rule("mkdocs", "MkDocs", "ssg", _m(files=["mkdocs.yml"]), dependencies=[pip_dep("mkdocs")]),
-    Rule("hexo", "Hexo", "ssg", dependencies=[npm("hexo")]),
-    Rule("mintlify", "Mintlify", "ssg", _m(files=["mint.json"])),
-
-    # ── BUILDERS / BUNDLERS ────────────────────────────────
-    Rule("vite", "Vite", "builder", _m(files=["vite.config.js", "vite.config.ts"]), dependencies=[npm("vite")]),
-    Rule("webpack", "Webpack", "builder", _m(files=["webpack.config.js", "webpack.config.ts"]), dependencies=[npm("webpack")]),
-    Rule("esbuild", "esbuild", "builder", dependencies=[npm("esbuild")]),
-    Rule("rollup", "Rollup", "builder", _m(files=["rollup.config.js", "rollup.config.ts"]), dependencies=[npm("rollup")]),
-    Rule("swc", "SWC", "builder", dependencies=[npm("@swc/core")]),
-    Rule("babel", "Babel", "builder", _m(files=["babel.config.js", ".babelrc", "babel.config.json"]), dependencies=[npm("@babel/core")]),
-    Rule("parcel", "Parcel", "builder", dependencies=[npm("parcel")]),
-    Rule("turborepo", "Turborepo", "builder", _m(files=["turbo.json"]), dependencies=[npm("turbo")]),
-    Rule("nx", "Nx", "builder", _m(files=["nx.json"]), dependencies=[npm("nx")]),
-    Rule("rspack", "Rspack", "builder", dependencies=[npm("@rspack/core")]),
-
-    # ── LINTERS / FORMATTERS ───────────────────────────────
-    Rule("eslint", "ESLint", "linter", _m(files=[".eslintrc", ".eslintrc.js", ".eslintrc.json", ".eslintrc.yml", "eslint.config.js", "eslint.config.mjs", "eslint.config.ts"]), dependencies=[npm("eslint")]),
-    Rule("prettier", "Prettier", "linter", _m(files=[".prettierrc", ".prettierrc.json", ".prettierrc.js", "prettier.config.js", "prettier.config.mjs"]), dependencies=[npm("prettier")]),
-    Rule("biome", "Biome", "linter", _m(files=["biome.json", "biome.jsonc"]), dependencies=[npm("@biomejs/biome")]),
-    Rule("stylelint", "Stylelint", "linter", _m(files=[".stylelintrc", ".stylelintrc.json"]), dependencies=[npm("stylelint")]),
-    Rule("oxlint", "oxlint", "linter", dependencies=[npm("oxlint")]),
-    Rule("rubocop", "RuboCop", "linter", _m(files=[".rubocop.yml"]), dependencies=[gem("rubocop")]),
-
-    # ── TESTING ────────────────────────────────────────────
-    Rule("jest", "Jest", "test", _m(files=["jest.config.js", "jest.config.ts", "jest.config.mjs"]), dependencies=[npm("jest")]),
-    Rule("vitest", "Vitest", "test", _m(files=["vitest.config.ts", "vitest.config.js"]), dependencies=[npm("vitest")]),
-    Rule("mocha", "Mocha", "test", dependencies=[npm("mocha")]),
-    Rule("cypress", "Cypress", "test", _m(files=["cypress.config.js", "cypress.config.ts", "cypress"]), dependencies=[npm("cypress")]),
-    Rule("playwright", "Playwright", "test", _m(files=["playwright.config.ts", "playwright.config.js"]), dependencies=[npm("@playwright/test"), npm("playwright"), pip_dep("playwright")]),
-    Rule("puppeteer", "Puppeteer", "test", dependencies=[npm("puppeteer")]),
-    Rule("selenium", "Selenium", "test", dependencies=[npm("selenium-webdriver"), pip_dep("selenium"), gem("selenium-webdriver")]),
-    Rule("testing-library", "Testing Library", "test", dependencies=[npm("@testing-library/react"), npm("@testing-library/jest-dom")]),
-    Rule("pytest", "pytest", "test", dependencies=[pip_dep("pytest")]),
-    Rule("phpunit", "PHPUnit", "test", _m(files=["phpunit.xml", "phpunit.xml.dist"]), dependencies=[composer("phpunit/phpunit")]),
-    Rule("k6", "k6", "test", dependencies=[npm("k6")]),
-
-    # ── VALIDATION ─────────────────────────────────────────
-    Rule("zod", "Zod", "validation", dependencies=[npm("zod")]),
-    Rule("joi", "Joi", "validation", dependencies=[npm("joi")]),
-    Rule("yup", "Yup", "validation", dependencies=[npm("yup")]),
-    Rule("valibot", "Valibot", "validation", dependencies=[npm("valibot")]),
-    Rule("typebox", "TypeBox", "validation", dependencies=[npm("@sinclair/typebox")]),
-    Rule("ajv", "Ajv", "validation", dependencies=[npm("ajv")]),
-
-    # ── ORM / DATA ACCESS ─────────────────────────────────
-    Rule("prisma", "Prisma", "orm", _m(files=["schema.prisma", "prisma/schema.prisma"]), dependencies=[npm("prisma"), npm("@prisma/client")]),
-    Rule("drizzle", "Drizzle", "orm", dependencies=[npm("drizzle-orm")]),
-    Rule("typeorm", "TypeORM", "orm", dependencies=[npm("typeorm")]),
-    Rule("sequelize", "Sequelize", "orm", _m(files=[".sequelizerc"]), dependencies=[npm("sequelize")]),
-    Rule("knex", "Knex", "orm", dependencies=[npm("knex")]),
-    Rule("kysely", "Kysely", "orm", dependencies=[npm("kysely")]),
-    Rule("mongoose", "Mongoose", "orm", dependencies=[npm("mongoose")]),
-    Rule("sqlalchemy", "SQLAlchemy", "orm", dependencies=[pip_dep("SQLAlchemy"), pip_dep("sqlalchemy")]),
-    Rule("gorm", "GORM", "orm", dependencies=[gomod("gorm.io/gorm")]),
-    Rule("diesel", "Diesel", "orm", _m(files=["diesel.toml"]), dependencies=[cargo("diesel")]),
-    Rule("doctrine", "Doctrine", "orm", dependencies=[composer("doctrine/orm")]),
-
-    # ── CI / CD ────────────────────────────────────────────
-    Rule("github-actions", "GitHub Actions", "ci", _m(files=[".github/workflows"])),
-    Rule("gitlab-ci", "GitLab CI", "ci", _m(files=[".gitlab-ci.yml"])),
-    Rule("jenkins", "Jenkins", "ci", _m(files=["Jenkinsfile"])),
-    Rule("circleci", "CircleCI", "ci", _m(files=[".circleci/config.yml", ".circleci"])),
-    Rule("travis", "Travis CI", "ci", _m(files=[".travis.yml"])),
-    Rule("azure-pipelines", "Azure Pipelines", "ci", _m(files=["azure-pipelines.yml"])),
-    Rule("bitbucket-pipelines", "Bitbucket Pipelines", "ci", _m(files=["bitbucket-pipelines.yml"])),
-    Rule("appveyor", "AppVeyor", "ci", _m(files=["appveyor.yml", ".appveyor.yml"])),
-    Rule("dependabot", "Dependabot", "ci", _m(files=[".github/dependabot.yml"])),
-    Rule("renovate", "Renovate", "ci", _m(files=["renovate.json", "renovate.json5", ".renovaterc", ".renovaterc.json"])),
-    Rule("codecov", "Codecov", "ci", _m(files=["codecov.yml", ".codecov.yml"])),
-    Rule("sonarcloud", "SonarCloud", "ci", _m(files=["sonar-project.properties"])),
-
-    # ── CLOUD PROVIDERS ────────────────────────────────────
-    Rule("aws", "AWS", "cloud", _m(files=["serverless.yml", "samconfig.toml", "template.yaml", "cdk.json"]), dependencies=[npm("aws-sdk"), npm("@aws-sdk/client-s3"), pip_dep("boto3")], dotenv=["AWS_"]),
-    Rule("gcp", "Google Cloud", "cloud", dependencies=[npm("@google-cloud/storage"), npm("@google-cloud/pubsub"), pip_dep("google-cloud-storage")], dotenv=["GOOGLE_CLOUD_", "GCP_", "GCLOUD_"]),
-    Rule("azure", "Azure", "cloud", dependencies=[npm("@azure/storage-blob"), npm("@azure/identity")], dotenv=["AZURE_"]),
-    Rule("firebase", "Firebase", "cloud", _m(files=["firebase.json", ".firebaserc"]), dependencies=[npm("firebase"), npm("firebase-admin")], dotenv=["FIREBASE_"]),
-    Rule("cloudflare", "Cloudflare", "cloud", _m(files=["wrangler.toml", "wrangler.json"]), dependencies=[npm("wrangler"), npm("@cloudflare/workers-types")]),
-    Rule("supabase", "Supabase", "cloud", _m(files=["supabase"]), dependencies=[npm("@supabase/supabase-js")], dotenv=["SUPABASE_", "NEXT_PUBLIC_SUPABASE_"]),
-    Rule("heroku", "Heroku", "cloud", _m(files=["Procfile", "app.json"])),
-    Rule("flyio", "Fly.io", "cloud", _m(files=["fly.toml"])),
-    Rule("railway", "Railway", "cloud", _m(files=["railway.json", "railway.toml"])),
-    Rule("dokku", "Dokku", "cloud", _m(files=["DOKKU_SCALE"])),
-
-    # ── HOSTING ────────────────────────────────────────────
-    Rule("vercel", "Vercel", "hosting", _m(files=["vercel.json", ".vercel"]), dependencies=[npm("@vercel/analytics")]),
-    Rule("netlify", "Netlify", "hosting", _m(files=["netlify.toml", "_redirects"])),
-    Rule("github-pages", "GitHub Pages", "hosting", _m(files=["CNAME"])),
-    Rule("docker", "Docker", "hosting", _m(files=["Dockerfile", "docker-compose.yml", "docker-compose.yaml", "compose.yaml", "compose.yml", ".dockerignore"])),
-    Rule("kubernetes", "Kubernetes", "hosting", _m(files=["k8s", "kubernetes", "skaffold.yaml"])),
-    Rule("digitalocean", "DigitalOcean", "hosting", _m(files=[".do/app.yaml"]), dotenv=["DIGITALOCEAN_"]),
-    Rule("render", "Render", "hosting", _m(files=["render.yaml"])),
-
-    # ── IAC ────────────────────────────────────────────────
-    Rule("terraform", "Terraform", "iac", _m(extensions=[".tf"], files=["main.tf", "terraform.tfvars"])),
-    Rule("pulumi", "Pulumi", "iac", _m(files=["Pulumi.yaml", "Pulumi.yml"]), dependencies=[npm("@pulumi/pulumi"), pip_dep("pulumi")]),
-    Rule("ansible", "Ansible", "iac", _m(files=["ansible.cfg", "playbook.yml"]), dependencies=[pip_dep("ansible")]),
-    Rule("helm", "Helm", "iac", _m(files=["Chart.yaml"])),
-    Rule("terragrunt", "Terragrunt", "iac", _m(files=["terragrunt.hcl"])),
-
-    # ── DATABASES ──────────────────────────────────────────
-    Rule("postgresql", "PostgreSQL", "db", dependencies=[npm("pg"), npm("postgres"), pip_dep("psycopg2"), pip_dep("psycopg"), docker("postgres")], dotenv=["POSTGRES_", "PG_", "DATABASE_URL"]),
-    Rule("mysql", "MySQL", "db", dependencies=[npm("mysql"), npm("mysql2"), pip_dep("mysqlclient"), pip_dep("PyMySQL"), docker("mysql")], dotenv=["MYSQL_"]),
-    Rule("mongodb", "MongoDB", "db", dependencies=[npm("mongodb"), pip_dep("pymongo"), pip_dep("motor"), docker("mongo")], dotenv=["MONGO_", "MONGODB_"]),
-    Rule("redis", "Redis", "db", dependencies=[npm("redis"), npm("ioredis"), pip_dep("redis"), docker("redis"), gomod("github.com/redis/go-redis")], dotenv=["REDIS_"]),
-    Rule("sqlite", "SQLite", "db", _m(extensions=[".sqlite", ".db"]), dependencies=[npm("better-sqlite3"), npm("sqlite3"), pip_dep("aiosqlite")]),
-    Rule("elasticsearch", "Elasticsearch", "db", dependencies=[npm("@elastic/elasticsearch"), pip_dep("elasticsearch"), docker("elasticsearch")], dotenv=["ELASTIC_", "ELASTICSEARCH_"]),
-    Rule("neo4j", "Neo4j", "db", dependencies=[npm("neo4j-driver"), pip_dep("neo4j"), docker("neo4j")]),
-    Rule("cassandra", "Cassandra", "db", dependencies=[npm("cassandra-driver"), pip_dep("cassandra-driver"), docker("cassandra")]),
-    Rule("clickhouse", "ClickHouse", "db", dependencies=[npm("@clickhouse/client"), docker("clickhouse/clickhouse-server"), pip_dep("clickhouse-connect")]),
-    Rule("influxdb", "InfluxDB", "db", dependencies=[npm("@influxdata/influxdb-client"), docker("influxdb")]),
-    Rule("mssql", "Microsoft SQL Server", "db", dependencies=[npm("mssql"), npm("tedious"), docker("mcr.microsoft.com/mssql/server")]),
-    Rule("mariadb", "MariaDB", "db", dependencies=[npm("mariadb"), docker("mariadb")]),
-    Rule("couchbase", "Couchbase", "db", dependencies=[npm("couchbase"), docker("couchbase")]),
-    Rule("dynamodb", "DynamoDB", "db", dependencies=[npm("@aws-sdk/client-dynamodb"), npm("dynamoose")], dotenv=["DYNAMODB_"]),
-    Rule("cockroachdb", "CockroachDB", "db", dependencies=[docker("cockroachdb/cockroach")]),
-    Rule("surrealdb", "SurrealDB", "db", dependencies=[npm("surrealdb.js"), docker("surrealdb/surrealdb")]),
-    Rule("duckdb", "DuckDB", "db", dependencies=[npm("duckdb"), pip_dep("duckdb")]),
-    Rule("neondb", "Neon", "db", dependencies=[npm("@neondatabase/serverless")], dotenv=["NEON_"]),
-    Rule("planetscale", "PlanetScale", "db", dependencies=[npm("@planetscale/database")], dotenv=["PLANETSCALE_"]),
-    Rule("turso", "Turso", "db", dependencies=[npm("@libsql/client")], dotenv=["TURSO_"]),
-    Rule("meilisearch", "Meilisearch", "db", dependencies=[npm("meilisearch"), docker("getmeili/meilisearch")]),
-    Rule("typesense", "Typesense", "db", dependencies=[npm("typesense"), docker("typesense/typesense")]),
-    Rule("algolia", "Algolia", "db", dependencies=[npm("algoliasearch")], dotenv=["ALGOLIA_"]),
-    # ── Vector DBs ──
-    Rule("pinecone", "Pinecone", "db", dependencies=[npm("@pinecone-database/pinecone"), pip_dep("pinecone-client")], dotenv=["PINECONE_"]),
-    Rule("chromadb", "ChromaDB", "db", dependencies=[npm("chromadb"), pip_dep("chromadb")]),
-    Rule("qdrant", "Qdrant", "db", dependencies=[npm("@qdrant/js-client-rest"), pip_dep("qdrant-client")]),
-    Rule("milvus", "Milvus", "db", dependencies=[npm("@zilliz/milvus2-sdk-node"), pip_dep("pymilvus")]),
-    Rule("weaviate", "Weaviate", "db", dependencies=[npm("weaviate-ts-client"), pip_dep("weaviate-client")]),
-
-    # ── QUEUE / MESSAGING ─────────────────────────────────
-    Rule("rabbitmq", "RabbitMQ", "queue", dependencies=[npm("amqplib"), pip_dep("pika"), docker("rabbitmq")], dotenv=["RABBITMQ_"]),
-    Rule("kafka", "Apache Kafka", "queue", dependencies=[npm("kafkajs"), pip_dep("kafka-python"), docker("confluentinc/cp-kafka")], dotenv=["KAFKA_"]),
-    Rule("bullmq", "BullMQ", "queue", dependencies=[npm("bullmq"), npm("bull")]),
-    Rule("sqs", "AWS SQS", "queue", dependencies=[npm("@aws-sdk/client-sqs")], dotenv=["SQS_"]),
-    Rule("nats", "NATS", "queue", dependencies=[npm("nats"), docker("nats")]),
-    Rule("celery", "Celery", "queue", dependencies=[pip_dep("celery")]),
-    Rule("pubsub", "Google Pub/Sub", "queue", dependencies=[npm("@google-cloud/pubsub")]),
-
-    # ── STORAGE ────────────────────────────────────────────
-    Rule("s3", "AWS S3", "storage", dependencies=[npm("@aws-sdk/client-s3"), pip_dep("boto3")], dotenv=["S3_", "AWS_S3_"]),
-    Rule("cloudflare-r2", "Cloudflare R2", "storage", dependencies=[npm("@cloudflare/r2")]),
-    Rule("cloudinary", "Cloudinary", "storage", dependencies=[npm("cloudinary")], dotenv=["CLOUDINARY_"]),
-    Rule("minio", "MinIO", "storage", dependencies=[npm("minio"), docker("minio/minio")]),
-
-    # ── AI / ML ────────────────────────────────────────────
-    Rule("openai", "OpenAI", "ai", dependencies=[npm("openai"), pip_dep("openai"), gomod("github.com/sashabaranov/go-openai")], dotenv=["OPENAI_"]),
-    Rule("anthropic", "Anthropic", "ai", dependencies=[npm("@anthropic-ai/sdk"), pip_dep("anthropic")], dotenv=["ANTHROPIC_"]),
-    Rule("google-ai", "Google AI / Gemini", "ai", dependencies=[npm("@google/generative-ai"), pip_dep("google-generativeai")], dotenv=["GOOGLE_AI_", "GEMINI_"]),
-    Rule("cohere", "Cohere", "ai", dependencies=[npm("cohere-ai"), pip_dep("cohere")], dotenv=["COHERE_"]),
-    Rule("huggingface", "Hugging Face", "ai", dependencies=[npm("@huggingface/inference"), pip_dep("transformers"), pip_dep("huggingface_hub")], dotenv=["HUGGINGFACE_", "HF_"]),
-    Rule("replicate", "Replicate", "ai", dependencies=[npm("replicate"), pip_dep("replicate")], dotenv=["REPLICATE_"]),
-    Rule("langchain", "LangChain", "ai", dependencies=[npm("langchain"), pip_dep("langchain")], dotenv=["LANGCHAIN_"]),
-    Rule("llamaindex", "LlamaIndex", "ai", dependencies=[npm("llamaindex"), pip_dep("llama-index")]),
-    Rule("vercel-ai", "Vercel AI SDK", "ai", dependencies=[npm("ai"), npm("@ai-sdk/openai")]),
-    Rule("ollama", "Ollama", "ai", dependencies=[npm("ollama"), pip_dep("ollama")], dotenv=["OLLAMA_"]),
-    Rule("mistral", "Mistral AI", "ai", dependencies=[npm("@mistralai/mistralai"), pip_dep("mistralai")], dotenv=["MISTRAL_"]),
-    Rule("groq", "Groq", "ai", dependencies=[npm("groq-sdk"), pip_dep("groq")], dotenv=["GROQ_"]),
-    Rule("deepseek", "DeepSeek", "ai", dependencies=[npm("deepseek"), pip_dep("deepseek")], dotenv=["DEEPSEEK_"]),
-    Rule("xai", "xAI", "ai", dependencies=[npm("@x-ai/sdk")], dotenv=["XAI_"]),
-    Rule("elevenlabs", "ElevenLabs", "ai", dependencies=[npm("elevenlabs"), pip_dep("elevenlabs")], dotenv=["ELEVENLABS_"]),
-    Rule("tensorflow", "TensorFlow", "ai", dependencies=[npm("@tensorflow/tfjs"), pip_dep("tensorflow")]),
-    Rule("pytorch", "PyTorch", "ai", dependencies=[pip_dep("torch"), pip_dep("pytorch")]),
-    Rule("aws-bedrock", "AWS Bedrock", "ai", dependencies=[npm("@aws-sdk/client-bedrock-runtime")], dotenv=["BEDROCK_"]),
-    Rule("azure-openai", "Azure OpenAI", "ai", dependencies=[npm("@azure/openai")], dotenv=["AZURE_OPENAI_"]),
-
-    # ── ANALYTICS ──────────────────────────────────────────
-    Rule("google-analytics", "Google Analytics", "analytics", dependencies=[npm("react-ga"), npm("react-ga4")], dotenv=["GA_", "GOOGLE_ANALYTICS_"]),
-    Rule("posthog", "PostHog", "analytics", dependencies=[npm("posthog-js"), npm("posthog-node"), pip_dep("posthog")], dotenv=["POSTHOG_", "NEXT_PUBLIC_POSTHOG_"]),
-    Rule("segment", "Segment", "analytics", dependencies=[npm("@segment/analytics-next"), npm("analytics-node")], dotenv=["SEGMENT_"]),
-    Rule("mixpanel", "Mixpanel", "analytics", dependencies=[npm("mixpanel"), npm("mixpanel-browser")], dotenv=["MIXPANEL_"]),
-    Rule("amplitude", "Amplitude", "analytics", dependencies=[npm("@amplitude/analytics-browser"), npm("@amplitude/analytics-node")], dotenv=["AMPLITUDE_"]),
-    Rule("plausible", "Plausible", "analytics", dependencies=[npm("plausible-tracker")], dotenv=["PLAUSIBLE_"]),
-    Rule("hotjar", "Hotjar", "analytics", dependencies=[npm("@hotjar/browser")]),
-    Rule("fathom", "Fathom", "analytics", dependencies=[npm("fathom-client")], dotenv=["FATHOM_"]),
-    Rule("vercel-analytics", "Vercel Analytics", "analytics", dependencies=[npm("@vercel/analytics")]),
-
-    # ── MONITORING / OBSERVABILITY ─────────────────────────
-    Rule("sentry", "Sentry", "monitoring", _m(files=[".sentryclirc"]), dependencies=[npm("@sentry/node"), npm("@sentry/browser"), npm("@sentry/react"), npm("@sentry/nextjs"), pip_dep("sentry-sdk"), cargo("sentry"), gem("sentry-ruby")], dotenv=["SENTRY_"]),
-    Rule("datadog", "Datadog", "monitoring", dependencies=[npm("dd-trace"), pip_dep("ddtrace")], dotenv=["DD_", "DATADOG_"]),
-    Rule("newrelic", "New Relic", "monitoring", _m(files=["newrelic.js", "newrelic.yml"]), dependencies=[npm("newrelic"), pip_dep("newrelic")], dotenv=["NEW_RELIC_", "NEWRELIC_"]),
-    Rule("opentelemetry", "OpenTelemetry", "monitoring", dependencies=[npm("@opentelemetry/api"), npm("@opentelemetry/sdk-node"), pip_dep("opentelemetry-api")], dotenv=["OTEL_"]),
-    Rule("prometheus", "Prometheus", "monitoring", dependencies=[npm("prom-client"), docker("prom/prometheus")]),
-    Rule("grafana", "Grafana", "monitoring", dependencies=[docker("grafana/grafana")], dotenv=["GRAFANA_"]),
-    Rule("logrocket", "LogRocket", "monitoring", dependencies=[npm("logrocket")], dotenv=["LOGROCKET_"]),
-    Rule("bugsnag", "Bugsnag", "monitoring", dependencies=[npm("@bugsnag/js"), npm("@bugsnag/react")], dotenv=["BUGSNAG_"]),
-    Rule("rollbar", "Rollbar", "monitoring", dependencies=[npm("rollbar"), pip_dep("rollbar")], dotenv=["ROLLBAR_"]),
-    Rule("pagerduty", "PagerDuty", "monitoring", dependencies=[npm("@pagerduty/pdjs")], dotenv=["PAGERDUTY_"]),
-    Rule("betterstack", "Better Stack", "monitoring", dependencies=[npm("@logtail/node")], dotenv=["LOGTAIL_", "BETTERSTACK_"]),
-    Rule("honeybadger", "Honeybadger", "monitoring", dependencies=[npm("@honeybadger-io/js")], dotenv=["HONEYBADGER_"]),
-
-    # ── AUTH ───────────────────────────────────────────────
-    Rule("auth0", "Auth0", "auth", dependencies=[npm("@auth0/nextjs-auth0"), npm("auth0"), npm("@auth0/auth0-react")], dotenv=["AUTH0_"]),
-    Rule("clerk", "Clerk", "auth", dependencies=[npm("@clerk/nextjs"), npm("@clerk/clerk-react")], dotenv=["CLERK_", "NEXT_PUBLIC_CLERK_"]),
-    Rule("nextauth", "NextAuth.js / Auth.js", "auth", dependencies=[npm("next-auth"), npm("@auth/core")]),
-    Rule("supabase-auth", "Supabase Auth", "auth", dependencies=[npm("@supabase/auth-helpers-nextjs"), npm("@supabase/ssr")]),
-    Rule("firebase-auth", "Firebase Auth", "auth", dependencies=[npm("firebase/auth"), npm("@react-firebase/auth")]),
-    Rule("okta", "Okta", "auth", dependencies=[npm("@okta/okta-react"), npm("@okta/okta-auth-js")], dotenv=["OKTA_"]),
-    Rule("kinde", "Kinde", "auth", dependencies=[npm("@kinde-oss/kinde-auth-nextjs")], dotenv=["KINDE_"]),
-    Rule("better-auth", "Better Auth", "auth", dependencies=[npm("better-auth")]),
-    Rule("logto", "Logto", "auth", dependencies=[npm("@logto/next")], dotenv=["LOGTO_"]),
-    Rule("cognito", "AWS Cognito", "auth", dependencies=[npm("@aws-sdk/client-cognito-identity-provider")], dotenv=["COGNITO_"]),
-    Rule("keycloak", "Keycloak", "auth", dependencies=[npm("keycloak-js"), docker("keycloak/keycloak")], dotenv=["KEYCLOAK_"]),
-
-    # ── PAYMENT ────────────────────────────────────────────
-    Rule("stripe", "Stripe", "payment", dependencies=[npm("stripe"), npm("@stripe/stripe-js"), pip_dep("stripe"), gem("stripe"), gomod("github.com/stripe/stripe-go")], dotenv=["STRIPE_"]),
-    Rule("paypal", "PayPal", "payment", dependencies=[npm("@paypal/checkout-server-sdk"), npm("@paypal/react-paypal-js")], dotenv=["PAYPAL_"]),
-    Rule("paddle", "Paddle", "payment", dependencies=[npm("@paddle/paddle-js")], dotenv=["PADDLE_"]),
-    Rule("lemon-squeezy", "Lemon Squeezy", "payment", dependencies=[npm("@lemonsqueezy/lemonsqueezy.js")], dotenv=["LEMONSQUEEZY_"]),
-    Rule("razorpay", "Razorpay", "payment", dependencies=[npm("razorpay")], dotenv=["RAZORPAY_"]),
-
-    # ── NOTIFICATION / EMAIL ───────────────────────────────
-    Rule("sendgrid", "SendGrid", "notification", dependencies=[npm("@sendgrid/mail")], dotenv=["SENDGRID_"]),
-    Rule("resend", "Resend", "notification", dependencies=[npm("resend")], dotenv=["RESEND_"]),
-    Rule("mailgun", "Mailgun", "notification", dependencies=[npm("mailgun.js"), npm("mailgun-js")], dotenv=["MAILGUN_"]),
-    Rule("twilio", "Twilio", "notification", dependencies=[npm("twilio"), pip_dep("twilio")], dotenv=["TWILIO_"]),
-    Rule("postmark", "Postmark", "notification", dependencies=[npm("postmark")], dotenv=["POSTMARK_"]),
-    Rule("ses", "AWS SES", "notification", dependencies=[npm("@aws-sdk/client-ses")], dotenv=["SES_"]),
-    Rule("novu", "Novu", "notification", dependencies=[npm("@novu/node")], dotenv=["NOVU_"]),
-
-    # ── CMS ────────────────────────────────────────────────
-    Rule("strapi", "Strapi", "cms", dependencies=[npm("@strapi/strapi")]),
-    Rule("sanity", "Sanity", "cms", dependencies=[npm("@sanity/client"), npm("sanity")], dotenv=["SANITY_", "NEXT_PUBLIC_SANITY_"]),
-    Rule("contentful", "Contentful", "cms", dependencies=[npm("contentful")], dotenv=["CONTENTFUL_"]),
-    Rule("wordpress", "WordPress", "cms", _m(files=["wp-config.php", "wp-content"])),
-    Rule("payload-cms", "Payload CMS", "cms", dependencies=[npm("payload")]),
-    Rule("ghost", "Ghost", "cms", dependencies=[npm("@tryghost/content-api")]),
-    Rule("datocms", "DatoCMS", "cms", dependencies=[npm("react-datocms")], dotenv=["DATOCMS_", "DATO_"]),
-    Rule("storyblok", "Storyblok", "cms", dependencies=[npm("@storyblok/react")], dotenv=["STORYBLOK_"]),
-    Rule("directus", "Directus", "cms", dependencies=[npm("@directus/sdk")]),
-    Rule("keystone", "Keystone", "cms", dependencies=[npm("@keystone-6/core")]),
-    Rule("shopify", "Shopify", "cms", dependencies=[npm("@shopify/shopify-api"), npm("@shopify/hydrogen")], dotenv=["SHOPIFY_"]),
-
-    # ── SECURITY ───────────────────────────────────────────
-    Rule("snyk", "Snyk", "security", _m(files=[".snyk"])),
-    Rule("vault", "HashiCorp Vault", "security", dependencies=[npm("node-vault"), docker("hashicorp/vault")], dotenv=["VAULT_"]),
-    Rule("infisical", "Infisical", "security", _m(files=[".infisical.json"]), dependencies=[npm("@infisical/sdk")], dotenv=["INFISICAL_"]),
-    Rule("gitguardian", "GitGuardian", "security", _m(files=[".gitguardian.yml"])),
-
-    # ── AUTOMATION ─────────────────────────────────────────
-    Rule("puppeteer-auto", "Puppeteer", "automation", dependencies=[npm("puppeteer")]),
-    Rule("playwright-auto", "Playwright", "automation", dependencies=[npm("playwright"), pip_dep("playwright")]),
-    Rule("n8n", "n8n", "automation", dependencies=[npm("n8n"), docker("n8nio/n8n")]),
-    Rule("inngest", "Inngest", "automation", dependencies=[npm("inngest")]),
-    Rule("temporal", "Temporal", "automation", dependencies=[npm("@temporalio/client"), pip_dep("temporalio")]),
-    Rule("trigger-dev", "Trigger.dev", "automation", dependencies=[npm("@trigger.dev/sdk")]),
-
-    # ── SAAS / MISC TOOLS ─────────────────────────────────
-    Rule("socketio", "Socket.IO", "tool", dependencies=[npm("socket.io"), npm("socket.io-client")]),
-    Rule("trpc", "tRPC", "tool", dependencies=[npm("@trpc/server"), npm("@trpc/client")]),
-    Rule("graphql", "GraphQL", "tool", dependencies=[npm("graphql"), npm("@apollo/client"), npm("urql")]),
-    Rule("openapi", "OpenAPI", "tool", _m(files=["openapi.yaml", "openapi.json", "swagger.yaml", "swagger.json"])),
-    Rule("grpc", "gRPC", "tool", dependencies=[npm("@grpc/grpc-js"), pip_dep("grpcio")]),
-    Rule("mcp", "Model Context Protocol", "tool", dependencies=[npm("@modelcontextprotocol/sdk"), pip_dep("mcp")]),
-    Rule("react-email", "React Email", "tool", dependencies=[npm("@react-email/components"), npm("react-email")]),
-    Rule("launchdarkly", "LaunchDarkly", "saas", dependencies=[npm("@launchdarkly/node-server-sdk")], dotenv=["LAUNCHDARKLY_"]),
-    Rule("figma", "Figma", "saas", dependencies=[npm("figma-api")], dotenv=["FIGMA_"]),
-
-    # ── PACKAGE MANAGERS ───────────────────────────────────
-    Rule("npm", "npm", "package_manager", _m(files=["package-lock.json"])),
-    Rule("yarn", "Yarn", "package_manager", _m(files=["yarn.lock"])),
-    Rule("pnpm", "pnpm", "package_manager", _m(files=["pnpm-lock.yaml", "pnpm-workspace.yaml"])),
-    Rule("bun-pkg", "Bun", "package_manager", _m(files=["bun.lockb", "bunfig.toml"])),
-    Rule("cargo-pkg", "Cargo", "package_manager", _m(files=["Cargo.lock"])),
-    Rule("pip-pkg", "pip", "package_manager", _m(files=["requirements.txt"])),
-    Rule("poetry", "Poetry", "package_manager", _m(files=["poetry.lock"]), dependencies=[pip_dep("poetry")]),
-    Rule("pipenv", "Pipenv", "package_manager", _m(files=["Pipfile.lock"])),
-    Rule("bundler", "Bundler", "package_manager", _m(files=["Gemfile.lock"])),
-    Rule("composer-pkg", "Composer", "package_manager", _m(files=["composer.lock"])),
-
-    # ── RUNTIME ────────────────────────────────────────────
-    Rule("nodejs", "Node.js", "runtime", _m(files=["package.json", ".nvmrc", ".node-version"])),
-    Rule("deno", "Deno", "runtime", _m(files=["deno.json", "deno.jsonc", "deno.lock"])),
-    Rule("bun-rt", "Bun", "runtime", _m(files=["bun.lockb", "bunfig.toml"])),
-
-    # ── APP / INFRASTRUCTURE IMAGES ────────────────────────
-    Rule("nginx", "Nginx", "app", _m(files=["nginx.conf"]), dependencies=[docker("nginx")]),
-    Rule("caddy", "Caddy", "app", _m(files=["Caddyfile"]), dependencies=[docker("caddy")]),
-    Rule("traefik", "Traefik", "app", dependencies=[docker("traefik")]),
-    Rule("kong", "Kong", "app", dependencies=[docker("kong")]),
-    Rule("haproxy", "HAProxy", "app", dependencies=[docker("haproxy")]),
-    Rule("vault-app", "HashiCorp Vault", "app", dependencies=[docker("hashicorp/vault")]),
-    Rule("consul", "Consul", "app", dependencies=[docker("consul")]),
-    Rule("zookeeper", "Zookeeper", "app", dependencies=[docker("zookeeper")]),
-    Rule("kibana", "Kibana", "app", dependencies=[docker("kibana")]),
-]
+
+def _load_cache() -> tuple | None:
+    try:
+        with open(_CACHE_PATH, "rb") as f:
+            mtime, payload = pickle.load(f)
+    except Exception:
+        return None
+    return payload if mtime == _SRC_MTIME else None
+
+
+def _save_cache(payload: tuple) -> None:
+    tmp = f"{_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump((_SRC_MTIME, payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, _CACHE_PATH)
+    except OSError:
+        pass
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  STRATEGY PARTITIONS
+# ═══════════════════════════════════════════════════════════════════
+#
+# RULES split by detection strategy, so a scanner pass that has just
+# gathered one kind of evidence (marker files, extensions, manifest
+# deps, ...) only walks the rules that can react to it. A rule using
+# several strategies appears in each relevant partition. Cheap to
+# derive, so rebuilt on initialization instead of being cached.
+
+
+def _build_partitions(rules: list[Rule]) -> dict[str, tuple[Rule, ...]]:
+    return {
+        "FILE_RULES": tuple(r for r in rules if r.match.files),
+        "EXT_RULES": tuple(r for r in rules if r.match.extensions),
+        "CONTENT_RULES": tuple(r for r in rules if r.match.content_patterns),
+        "DEP_RULES": tuple(r for r in rules if r.dependencies),
+        "DOTENV_RULES": tuple(r for r in rules if r.dotenv),
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  CONTENT AUTOMATA
+# ═══════════════════════════════════════════════════════════════════
+#
+# One multi-pattern matcher per content-scanned filename, so a file's
+# text is walked once for all rules instead of once per pattern. Uses
+# pyahocorasick when installed; otherwise a single alternation regex
+# (still one pass, built from the longest pattern down so a pattern
+# that contains another is preferred at the same offset).
+
+
+class _RegexAutomaton:
+    """Fallback exposing the same iter() shape as ahocorasick.Automaton."""
+
+    __slots__ = ("_re", "_values")
+
+    def __init__(self, values: dict[str, tuple[str, ...]]) -> None:
+        self._values = values
+        ordered = sorted(values, key=len, reverse=True)
+        self._re = re.compile("|".join(re.escape(p) for p in ordered))
+
+    def iter(self, text: str) -> Iterator[tuple[int, tuple[str, ...]]]:
+        for m in self._re.finditer(text):
+            yield m.end() - 1, self._values[m.group(0)]
+
+
+def _build_automata(
+    content_index: dict[str, tuple[tuple[str, tuple[str, ...]], ...]],
+) -> dict[str, object]:
+    automata: dict[str, object] = {}
+    for fname, entries in content_index.items():
+        # Several rules may scan this file for the same pattern, so the
+        # payload carries every rule id sharing it (a single-id mapping
+        # would keep only the last rule registered).
+        grouped: dict[str, list[str]] = {}
+        for rid, pats in entries:
+            for p in pats:
+                grouped.setdefault(p, []).append(rid)
+        values = {p: tuple(rids) for p, rids in grouped.items()}
+        if ahocorasick is not None:
+            a = ahocorasick.Automaton()
+            for p, rids in values.items():
+                a.add_word(p, rids)
+            a.make_automaton()
+            automata[fname] = a
+        else:
+            automata[fname] = _RegexAutomaton(values)
+    return automata
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  DOTENV PREFIX LOOKUP
+# ═══════════════════════════════════════════════════════════════════
+#
+# Matching every env-var name against every dotenv prefix is a
+# len(prefixes) x len(vars) startswith scan. Bucketing prefixes by
+# length instead makes a lookup one hash probe per distinct prefix
+# length (a flattened trie), and unlike bisect it still finds nested
+# prefixes such as "AWS_" inside "AWS_S3_".
+
+
+def _build_dotenv_lookup(
+    index: tuple[tuple[str, str], ...],
+) -> tuple[dict[str, tuple[str, ...]], tuple[int, ...]]:
+    grouped: dict[str, list[str]] = {}
+    for prefix, rid in index:
+        grouped.setdefault(prefix, []).append(rid)
+    table = {p: tuple(rids) for p, rids in grouped.items()}
+    return table, tuple(sorted({len(p) for p in table}))
+
+
+# Declarations only — assigning here would defeat the `not in globals()`
+# lazy-init probe below. They give type checkers (and the mypyc build
+# hook in setup.py) definitions for the lazily-filled globals.
+DOTENV_PREFIX_TABLE: dict[str, tuple[str, ...]]
+_DOTENV_PREFIX_LENS: tuple[int, ...]
+
+
+def dotenv_rules_for(name: str) -> tuple[str, ...]:
+    """Ids of rules whose dotenv prefix matches this env-var name."""
+    if "DOTENV_PREFIX_TABLE" not in globals():
+        _init_catalog()
+    out: list[str] = []
+    for ln in _DOTENV_PREFIX_LENS:
+        if ln > len(name):
+            break
+        rids = DOTENV_PREFIX_TABLE.get(name[:ln])
+        if rids:
+            out.extend(rids)
+    return tuple(out)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  LAZY INITIALIZATION (PEP 562)
+# ═══════════════════════════════════════════════════════════════════
+#
+# Invocations that never evaluate rules (--help, input-file errors, a
+# failed clone) should not pay for the catalog at all, so nothing is
+# built at import. First attribute access to any catalog name triggers
+# one _init_catalog() pass that fills module globals, and every later
+# access is an ordinary module-dict hit.
+
+_LAZY_ATTRS = frozenset({
+    "RULES", "RULES_VALIDATED",
+    "EXT_INDEX", "FILE_INDEX", "CONTENT_INDEX", "DEP_INDEX", "DOTENV_INDEX",
+    "FILE_RULES", "EXT_RULES", "CONTENT_RULES", "DEP_RULES", "DOTENV_RULES",
+    "ALL_EXTENSIONS", "EXT_FIRST_BYTE", "CONTENT_AUTOMATA",
+    "DOTENV_PREFIX_TABLE", "_DOTENV_PREFIX_LENS",
+})
+
+
+def _init_catalog() -> None:
+    g = globals()
+    if "RULES" in g:
+        return
+
+    cached = _load_cache()
+    if cached is not None:
+        rules, ext, files, content, deps, dotenv = cached
+    else:
+        rules = _build_rules()
+        ext, files, content, deps, dotenv = _build_indexes(rules)
+        _save_cache((rules, ext, files, content, deps, dotenv))
+
+    g["EXT_INDEX"] = ext
+    g["FILE_INDEX"] = files
+    g["CONTENT_INDEX"] = content
+    g["DEP_INDEX"] = deps
+    g["DOTENV_INDEX"] = dotenv
+    g.update(_build_partitions(rules))
+    all_ext = frozenset().union(*(r.match.extensions for r in rules))
+    g["ALL_EXTENSIONS"] = all_ext
+    # Bitmap over the byte following the dot: extensions whose first
+    # letter no rule uses are rejected with a shift+mask, no hashing.
+    first_byte = 0
+    for e in all_ext:
+        if len(e) > 1:
+            first_byte |= 1 << ord(e[1])
+    g["EXT_FIRST_BYTE"] = first_byte
+    g["CONTENT_AUTOMATA"] = _build_automata(content)
+    g["DOTENV_PREFIX_TABLE"], g["_DOTENV_PREFIX_LENS"] = _build_dotenv_lookup(dotenv)
+    # Catalog entries are validated where they are built: _build_rules
+    # rejects unknown type strings and the DepType enum cannot encode an
+    # unknown dependency type, so per-scan validation is unnecessary. A
+    # cache hit reuses a previously validated build.
+    g["RULES_VALIDATED"] = True
+    # Published last: its presence is the "already initialized" signal.
+    g["RULES"] = rules
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        _init_catalog()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
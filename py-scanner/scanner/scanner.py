@@ -5,15 +5,93 @@ across multiple repositories with controlled concurrency.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-from .repo_manager import prepare_repo, cleanup_repo
+from . import rules as _rules
+from .analyser import _ROOT_EVIDENCE
+from .repo_manager import prepare_repo, cleanup_repo, recorded_head
 from .analyser import analyse
 from .reporter import build_success_report, build_error_report
 
 logger = logging.getLogger("scanner")
 
+# ── Analysis result cache ──────────────────────────────────
+#
+# Re-scans of an unchanged repo (CI reruns, a workspace mirror inside
+# the pull TTL) skip analyse() entirely. Only workspace clones with a
+# recorded HEAD sha are cached: the sha invalidates on any pulled
+# commit, whatever files it touched, and the key also mixes in the
+# stat of every root marker the analyser reacts to plus the
+# rules-catalog mtime. Local-path repos are edited in place with no
+# sha to anchor on — a marker-stat key alone would keep serving stale
+# results after e.g. a new root source file — so they always re-run
+# analyse(). Fresh clones get new mtimes and simply miss.
+
+_ANALYSE_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "py-scanner", "analyse-v1")
+
+# Every root file the analyser treats as evidence, plus the .env files
+# it reads for dotenv scanning (dot-prefixed, so not in _ROOT_EVIDENCE).
+_FINGERPRINT_FILES = tuple(sorted(_ROOT_EVIDENCE)) + (
+    ".env", ".env.local", ".env.example", ".env.development",
+    ".env.production", ".env.test",
+)
+
+
+def _fingerprint(repo_path: str) -> str | None:
+    """Cheap content key for a workspace clone, or None when uncacheable."""
+    head = recorded_head(repo_path)
+    if not head:
+        return None
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repo_path.encode())
+    h.update(str(_rules._SRC_MTIME).encode())
+    h.update(head.encode())
+    found = False
+    for f in _FINGERPRINT_FILES:
+        try:
+            st = os.stat(os.path.join(repo_path, f))
+        except OSError:
+            continue
+        found = True
+        h.update(f"{f}:{st.st_size}:{st.st_mtime_ns}".encode())
+    return h.hexdigest() if found else None
+
+
+def _load_analysis(key: str) -> list[dict] | None:
+    try:
+        with open(os.path.join(_ANALYSE_CACHE_DIR, f"{key}.json"), "rb") as f:
+            return json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _store_analysis(key: str, matched: list[dict]) -> None:
+    path = os.path.join(_ANALYSE_CACHE_DIR, f"{key}.json")
+    try:
+        os.makedirs(_ANALYSE_CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(matched, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _analyse_repo(local_path: str) -> list[dict]:
+    """Analyse one prepared repo, going through the result cache."""
+    key = _fingerprint(local_path)
+    matched = _load_analysis(key) if key else None
+    if matched is None:
+        matched = analyse(local_path)
+        if key:
+            _store_analysis(key, matched)
+    return matched
+
 
 def _scan_one(name: str, url: str, cleanup: bool) -> dict:
     """Scan a single repository."""
@@ -22,7 +100,7 @@ def _scan_one(name: str, url: str, cleanup: bool) -> dict:
         local_path, is_temporary = prepare_repo(name, url)
         logger.info(f"[{name}] Analysing {local_path}…")
 
-        matched = analyse(local_path)
+        matched = _analyse_repo(local_path)
 
         report = build_success_report(name, matched)
         results = report.get("results", {})
@@ -49,16 +127,43 @@ def scan(repos: list[dict[str, str]], concurrency: int = 1, cleanup: bool = Fals
         return [_scan_one(r["name"], r["url"], cleanup) for r in repos]
 
     reports: list[dict] = [{}] * len(repos)
+
+    # Phase 1: prepare (clone/pull) — pure I/O, so threads overlap it.
+    prepared: dict[int, tuple[str, bool]] = {}
     with ThreadPoolExecutor(max_workers=concurrency) as executor:
         future_to_idx = {
-            executor.submit(_scan_one, r["name"], r["url"], cleanup): i
+            executor.submit(prepare_repo, r["name"], r["url"]): i
             for i, r in enumerate(repos)
         }
         for future in as_completed(future_to_idx):
             idx = future_to_idx[future]
             try:
-                reports[idx] = future.result()
+                prepared[idx] = future.result()
             except Exception as err:
+                logger.error(f"[{repos[idx]['name']}] Failed: {err}")
                 reports[idx] = build_error_report(repos[idx]["name"], err)
 
+    # Phase 2: analyse — regex/JSON/rule work serializes on the GIL, so
+    # it goes to processes; each worker loads the pickled rules cache.
+    if prepared:
+        workers = min(concurrency, os.cpu_count() or 1, len(prepared))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            future_to_idx = {
+                executor.submit(_analyse_repo, path): i
+                for i, (path, _) in prepared.items()
+            }
+            for future in as_completed(future_to_idx):
+                idx = future_to_idx[future]
+                name = repos[idx]["name"]
+                try:
+                    reports[idx] = build_success_report(name, future.result())
+                except Exception as err:
+                    logger.error(f"[{name}] Failed: {err}")
+                    reports[idx] = build_error_report(name, err)
+
+        if cleanup:
+            for path, is_temporary in prepared.values():
+                if is_temporary:
+                    cleanup_repo(path)
+
     return reports
@@ -0,0 +1,26 @@
+"""
+Build hook: compiles the analyser with mypyc when mypy is installed.
+
+The hot path after indexing is tight dict/set work in scanner/analyser.py,
+which mypyc speeds up severalfold. The compilation is strictly optional —
+without mypy the build produces the ordinary pure-Python package, and the
+compiled extension transparently shadows the .py module when present.
+rules.py is left uncompiled: its PEP 562 lazy-init machinery relies on
+module-globals behaviour that mypyc does not reproduce.
+"""
+
+from setuptools import setup
+
+ext_modules = []
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    pass
+else:
+    try:
+        ext_modules = mypycify(["scanner/analyser.py"])
+    except BaseException:  # mypyc reports type errors via SystemExit
+        print("mypyc compilation failed; building pure-Python package")
+        ext_modules = []
+
+setup(ext_modules=ext_modules)